@@ -11,10 +11,15 @@ Prerequisites:
 
     2. Install Python dependencies:
        pip install playwright pyyaml pillow
+       pip install orjson  # Optional: faster JSON output
+       # Optional: install oxipng (e.g. brew install oxipng) for smaller PNGs
        playwright install chromium
 
 Usage:
     python3 capture-screenshots.py
+    python3 capture-screenshots.py --fresh   # Discard saved logins first
+    python3 capture-screenshots.py --headful # Show the browser for debugging
+    python3 capture-screenshots.py --no-optimize  # Skip the oxipng pass
 
 Output:
     docs/images/           - Plain screenshots
@@ -31,13 +36,24 @@ Image Annotator MCP Integration:
     The metadata includes MCP-ready format for direct tool calls.
 """
 
-from playwright.sync_api import sync_playwright
-import time
+from playwright.async_api import async_playwright
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, is_dataclass
+import argparse
+import asyncio
+import concurrent.futures
 import os
 import shutil
+import subprocess
 import json
+import time
 import uuid
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the stdlib json module
+    orjson = None
+
 # =============================================================================
 # CONFIGURATION - Customize for your project
 # =============================================================================
@@ -71,12 +87,45 @@ METADATA_DIR = f"/tmp/screenshot-metadata-{SITE_CONFIG.get('plugin_page', 'defau
 
 # Browser settings
 VIEWPORT = {"width": 1680, "height": 1100}
-HEADLESS = False  # Set True for CI/CD, False for debugging
-WAIT_TIME = 2  # Seconds to wait after page load
+HEADLESS = True  # Pass --headful to watch the browser while debugging
+# Skip the GPU process and use /tmp instead of the small /dev/shm found in
+# containers. Playwright already launches Chromium without its sandbox.
+BROWSER_ARGS = ["--disable-dev-shm-usage", "--disable-gpu"]
+WAIT_TIME = 0.1  # Safety margin (seconds) after the ready element appears
+READY_TIMEOUT = 5000  # Max ms to wait for a capture's ready element
+ADMIN_WAIT_FOR = "#wpbody-content"  # Ready element for wp-admin pages
+FRONTEND_WAIT_FOR = "body"  # Ready element for frontend pages
+NETWORK_IDLE_TIMEOUT = 10  # Max seconds to wait on captures with "network_idle"
+
+# Request blocking: skip bytes that never show up in a screenshot.
+# Routing disables Chromium's HTTP cache, so set False on sites without
+# media or trackers. Fonts stay allowed because wp-admin icons (dashicons)
+# are a webfont; add "font" here if icons don't matter.
+BLOCK_REQUESTS = True
+BLOCKED_RESOURCE_TYPES = {"media"}
+BLOCKED_URL_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.com/tr",
+    "connect.facebook.net",
+    "hotjar.com",
+)
 MAX_RETRIES = 3  # Retry failed captures
-
-# Session storage (unique per plugin)
+BOUNDS_TIMEOUT = 10  # Seconds to resolve all annotation bounds on a page
+# Encoder for captures without annotations. "jpeg" encodes faster and is
+# 3-5x smaller but saves as .jpg; annotated captures always stay PNG.
+PLAIN_FORMAT = "png"
+JPEG_QUALITY = 85
+# Losslessly recompress PNGs with oxipng (if installed) in the background
+OPTIMIZE_PNGS = True
+OXIPNG = shutil.which("oxipng")
+POOL_SIZE = 4  # Logged-in browser contexts sharing one Chromium process
+
+# Session storage (unique per plugin). Saved logins are reused across runs
+# until they are older than SESSION_MAX_AGE; pass --fresh to discard them.
 SESSION_DIR = f"/tmp/playwright-wp-session-{SITE_CONFIG.get('plugin_page', 'default')}"
+SESSION_MAX_AGE = 30 * 60  # Seconds
 
 # =============================================================================
 # TYPE MAPPING: Capture Script Types → Image Annotator MCP Types
@@ -114,6 +163,11 @@ DEFAULT_COLORS = {
 #   - label: Text description for the annotation
 #   - type: arrow, circle, box, number, highlight
 #   - position: where to place label (top, bottom, left, right, auto)
+# Before capturing, the script waits for "wait_for" (CSS selector) if set,
+# otherwise for the first annotation's selector, otherwise for the page body.
+# Set "block_images": True on a tab to skip image downloads for that capture.
+# Set "network_idle": True to also wait until the page's requests settle
+# (e.g. AJAX-loaded charts with no single element to wait for).
 ADMIN_TABS = [
     # Example with annotations:
     # {
@@ -134,6 +188,7 @@ FRONTEND_PAGES = [
     #     "url": "/members/{username}/blog/",
     #     "filename": "member-blog-tab.png",
     #     "full_page": False,
+    #     "wait_for": ".post-list",
     #     "annotations": [
     #         {"selector": "#subnav a[href*='/blog/']", "label": "Blog Tab", "type": "circle"},
     #         {"selector": ".post-list", "label": "Your Published Posts", "type": "box", "position": "right"},
@@ -164,24 +219,193 @@ ROLE_CAPTURES = [
 # ANNOTATION FUNCTIONS
 # =============================================================================
 
-def get_element_bounds(page, selector):
-    """Get bounding box for an element."""
-    try:
-        element = page.locator(selector).first
-        if element.is_visible():
-            box = element.bounding_box()
-            if box:
-                return {
-                    "x": int(box["x"]),
-                    "y": int(box["y"]),
-                    "width": int(box["width"]),
-                    "height": int(box["height"]),
-                    "center_x": int(box["x"] + box["width"] / 2),
-                    "center_y": int(box["y"] + box["height"] / 2),
-                }
-    except Exception as e:
-        print(f"    Warning: Could not get bounds for '{selector}': {e}")
-    return None
+# Reads the page title and every annotation box in one round-trip.
+# Selectors must be plain CSS (document.querySelector), not Playwright-only syntax.
+PAGE_STATE_JS = """(selectors) => ({
+    title: document.title,
+    boxes: selectors.map((selector) => {
+        let el;
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {
+            return null;
+        }
+        if (!el || getComputedStyle(el).visibility === 'hidden') return null;
+        const r = el.getBoundingClientRect();
+        return r.width && r.height ? {x: r.x, y: r.y, width: r.width, height: r.height} : null;
+    }),
+})"""
+
+
+def to_bounds(box):
+    """Convert a raw bounding box into integer bounds with its center point."""
+    if not box:
+        return None
+    return {
+        "x": int(box["x"]),
+        "y": int(box["y"]),
+        "width": int(box["width"]),
+        "height": int(box["height"]),
+        "center_x": int(box["x"] + box["width"] / 2),
+        "center_y": int(box["y"] + box["height"] / 2),
+    }
+
+
+# Shared defaults for text labels attached to rect/arrow/circle annotations
+_LABEL_BASE = {
+    "type": "label",
+    "color": "darkGray",
+    "fontSize": 14,
+    "background": "white",
+    "shadow": True,
+}
+
+# Callout pointer faces back toward the element
+_CALLOUT_POINTERS = {"top": "bottom", "bottom": "top", "left": "right", "right": "left"}
+
+
+def _label(text, x, y):
+    """Build a text label from the shared label defaults."""
+    return {**_LABEL_BASE, "text": text, "x": x, "y": y}
+
+
+def _mk_marker(bounds, label, position, number, color):
+    """Numbered circle at center of element."""
+    return {
+        "type": "marker",
+        "x": bounds["center_x"],
+        "y": bounds["center_y"],
+        "number": number,
+        "color": color,
+        "size": 24,
+    }
+
+
+def _mk_rect(bounds, label, position, number, color):
+    """Rectangle around element with padding, plus an optional label."""
+    padding = 4
+    mcp_ann = {
+        "type": "rect",
+        "x": bounds["x"] - padding,
+        "y": bounds["y"] - padding,
+        "width": bounds["width"] + (padding * 2),
+        "height": bounds["height"] + (padding * 2),
+        "color": color,
+        "strokeWidth": 3,
+    }
+    if label:
+        # Position label based on preference
+        if position == "top":
+            mcp_ann["_label"] = _label(label, bounds["center_x"], bounds["y"] - 25)
+        elif position == "bottom":
+            mcp_ann["_label"] = _label(label, bounds["center_x"], bounds["y"] + bounds["height"] + 20)
+        elif position == "left":
+            mcp_ann["_label"] = _label(label, bounds["x"] - 10, bounds["center_y"])
+        else:  # right or auto
+            mcp_ann["_label"] = _label(label, bounds["x"] + bounds["width"] + 15, bounds["center_y"])
+    return mcp_ann
+
+
+def _mk_arrow(bounds, label, position, number, color):
+    """Arrow pointing to element from label position."""
+    label_offset = 100
+    if position == "left":
+        from_pt = [bounds["x"] - label_offset, bounds["center_y"]]
+        to_pt = [bounds["x"] - 5, bounds["center_y"]]
+    elif position == "top":
+        from_pt = [bounds["center_x"], bounds["y"] - label_offset]
+        to_pt = [bounds["center_x"], bounds["y"] - 5]
+    elif position == "bottom":
+        from_pt = [bounds["center_x"], bounds["y"] + bounds["height"] + label_offset]
+        to_pt = [bounds["center_x"], bounds["y"] + bounds["height"] + 5]
+    else:  # right or auto
+        from_pt = [bounds["x"] + bounds["width"] + label_offset, bounds["center_y"]]
+        to_pt = [bounds["x"] + bounds["width"] + 5, bounds["center_y"]]
+
+    mcp_ann = {
+        "type": "arrow",
+        "from": from_pt,
+        "to": to_pt,
+        "color": color,
+        "strokeWidth": 2,
+    }
+    # Add label at arrow start
+    if label:
+        offset = 10 if position in ("left", "auto") else -10
+        mcp_ann["_label"] = _label(label, from_pt[0] + offset, from_pt[1])
+    return mcp_ann
+
+
+def _mk_circle(bounds, label, position, number, color):
+    """Circle around element, plus an optional label to its right."""
+    radius = max(bounds["width"], bounds["height"]) // 2 + 8
+    mcp_ann = {
+        "type": "circle",
+        "x": bounds["center_x"],
+        "y": bounds["center_y"],
+        "radius": radius,
+        "color": color,
+        "strokeWidth": 3,
+    }
+    if label:
+        mcp_ann["_label"] = _label(label, bounds["center_x"] + radius + 15, bounds["center_y"])
+    return mcp_ann
+
+
+def _mk_highlight(bounds, label, position, number, color):
+    """Semi-transparent highlight."""
+    return {
+        "type": "highlight",
+        "x": bounds["x"],
+        "y": bounds["y"],
+        "width": bounds["width"],
+        "height": bounds["height"],
+        "color": "yellow",
+        "opacity": 0.35,
+    }
+
+
+def _mk_callout(bounds, label, position, number, color):
+    """Speech bubble with pointer."""
+    return {
+        "type": "callout",
+        "x": bounds["center_x"],
+        "y": bounds["center_y"],
+        "text": label,
+        "pointer": _CALLOUT_POINTERS.get(position, "left"),
+        "color": color,
+        "background": "white",
+        "shadow": True,
+    }
+
+
+def _mk_label(bounds, label, position, number, color):
+    """Text label with background, above the element."""
+    return _label(label, bounds["center_x"], bounds["y"] - 20)
+
+
+def _mk_blur(bounds, label, position, number, color):
+    """Blur area."""
+    return {
+        "type": "blur",
+        "x": bounds["x"],
+        "y": bounds["y"],
+        "width": bounds["width"],
+        "height": bounds["height"],
+        "intensity": 8,
+    }
+
+
+_HANDLERS = {
+    "marker": _mk_marker,
+    "rect": _mk_rect,
+    "arrow": _mk_arrow,
+    "circle": _mk_circle,
+    "highlight": _mk_highlight,
+    "callout": _mk_callout,
+    "label": _mk_label,
+    "blur": _mk_blur,
+}
 
 
 def convert_to_mcp_format(ann_type, bounds, label="", position="auto", number=1):
@@ -198,174 +422,30 @@ def convert_to_mcp_format(ann_type, bounds, label="", position="auto", number=1)
     - callout: {x, y, text, pointer, color, background}
     """
     mcp_type = TYPE_MAPPING.get(ann_type, ann_type)
-    color = DEFAULT_COLORS.get(mcp_type, "red")
-
-    # Base annotation with type
-    mcp_ann = {"type": mcp_type}
-
-    if mcp_type == "marker":
-        # Numbered circle at center of element
-        mcp_ann.update({
-            "x": bounds["center_x"],
-            "y": bounds["center_y"],
-            "number": number,
-            "color": color,
-            "size": 24,
-        })
-
-    elif mcp_type == "rect":
-        # Rectangle around element with padding
-        padding = 4
-        mcp_ann.update({
-            "x": bounds["x"] - padding,
-            "y": bounds["y"] - padding,
-            "width": bounds["width"] + (padding * 2),
-            "height": bounds["height"] + (padding * 2),
-            "color": color,
-            "strokeWidth": 3,
-        })
-        # Add label if provided
-        if label:
-            mcp_ann["_label"] = {
-                "type": "label",
-                "text": label,
-                "color": "darkGray",
-                "fontSize": 14,
-                "background": "white",
-                "shadow": True,
-            }
-            # Position label based on preference
-            if position == "top":
-                mcp_ann["_label"]["x"] = bounds["center_x"]
-                mcp_ann["_label"]["y"] = bounds["y"] - 25
-            elif position == "bottom":
-                mcp_ann["_label"]["x"] = bounds["center_x"]
-                mcp_ann["_label"]["y"] = bounds["y"] + bounds["height"] + 20
-            elif position == "left":
-                mcp_ann["_label"]["x"] = bounds["x"] - 10
-                mcp_ann["_label"]["y"] = bounds["center_y"]
-            else:  # right or auto
-                mcp_ann["_label"]["x"] = bounds["x"] + bounds["width"] + 15
-                mcp_ann["_label"]["y"] = bounds["center_y"]
-
-    elif mcp_type == "arrow":
-        # Arrow pointing to element from label position
-        label_offset = 100
-        if position == "left":
-            from_pt = [bounds["x"] - label_offset, bounds["center_y"]]
-            to_pt = [bounds["x"] - 5, bounds["center_y"]]
-        elif position == "right":
-            from_pt = [bounds["x"] + bounds["width"] + label_offset, bounds["center_y"]]
-            to_pt = [bounds["x"] + bounds["width"] + 5, bounds["center_y"]]
-        elif position == "top":
-            from_pt = [bounds["center_x"], bounds["y"] - label_offset]
-            to_pt = [bounds["center_x"], bounds["y"] - 5]
-        elif position == "bottom":
-            from_pt = [bounds["center_x"], bounds["y"] + bounds["height"] + label_offset]
-            to_pt = [bounds["center_x"], bounds["y"] + bounds["height"] + 5]
-        else:  # auto - default to right
-            from_pt = [bounds["x"] + bounds["width"] + label_offset, bounds["center_y"]]
-            to_pt = [bounds["x"] + bounds["width"] + 5, bounds["center_y"]]
-
-        mcp_ann.update({
-            "from": from_pt,
-            "to": to_pt,
-            "color": color,
-            "strokeWidth": 2,
-        })
-        # Add label at arrow start
-        if label:
-            mcp_ann["_label"] = {
-                "type": "label",
-                "x": from_pt[0] + (10 if position in ["left", "auto"] else -10),
-                "y": from_pt[1],
-                "text": label,
-                "color": "darkGray",
-                "fontSize": 14,
-                "background": "white",
-                "shadow": True,
-            }
-
-    elif mcp_type == "circle":
-        # Circle around element
-        radius = max(bounds["width"], bounds["height"]) // 2 + 8
-        mcp_ann.update({
-            "x": bounds["center_x"],
-            "y": bounds["center_y"],
-            "radius": radius,
-            "color": color,
-            "strokeWidth": 3,
-        })
-        if label:
-            mcp_ann["_label"] = {
-                "type": "label",
-                "x": bounds["center_x"] + radius + 15,
-                "y": bounds["center_y"],
-                "text": label,
-                "color": "darkGray",
-                "fontSize": 14,
-                "background": "white",
-                "shadow": True,
-            }
-
-    elif mcp_type == "highlight":
-        # Semi-transparent highlight
-        mcp_ann.update({
-            "x": bounds["x"],
-            "y": bounds["y"],
-            "width": bounds["width"],
-            "height": bounds["height"],
-            "color": "yellow",
-            "opacity": 0.35,
-        })
-
-    elif mcp_type == "callout":
-        # Speech bubble with pointer
-        pointer_dir = {"top": "bottom", "bottom": "top", "left": "right", "right": "left"}.get(position, "left")
-        mcp_ann.update({
-            "x": bounds["center_x"],
-            "y": bounds["center_y"],
-            "text": label,
-            "pointer": pointer_dir,
-            "color": color,
-            "background": "white",
-            "shadow": True,
-        })
-
-    elif mcp_type == "label":
-        # Text label with background
-        mcp_ann.update({
-            "x": bounds["center_x"],
-            "y": bounds["y"] - 20,
-            "text": label,
-            "color": "darkGray",
-            "fontSize": 14,
-            "background": "white",
-            "shadow": True,
-        })
-
-    elif mcp_type == "blur":
-        # Blur area
-        mcp_ann.update({
-            "x": bounds["x"],
-            "y": bounds["y"],
-            "width": bounds["width"],
-            "height": bounds["height"],
-            "intensity": 8,
-        })
+    handler = _HANDLERS.get(mcp_type)
+    if handler is None:
+        return {"type": mcp_type}
+    return handler(bounds, label, position, number, DEFAULT_COLORS.get(mcp_type, "red"))
 
-    return mcp_ann
+
+async def read_page_state(page, annotations, filename):
+    """Fetch the page title and all annotation bounds in a single evaluate call."""
+    selectors = [ann.get("selector", "") for ann in annotations]
+    try:
+        state = await asyncio.wait_for(page.evaluate(PAGE_STATE_JS, selectors), timeout=BOUNDS_TIMEOUT)
+    except asyncio.TimeoutError:
+        print(f"    Warning: {filename}: Timed out reading page state after {BOUNDS_TIMEOUT}s")
+        return "", [None] * len(selectors)
+    return state["title"], [to_bounds(box) for box in state["boxes"]]
 
 
-def extract_annotations(page, annotations):
-    """Extract element positions and generate MCP-ready annotations."""
+def extract_annotations(annotations, all_bounds, filename=""):
+    """Pair annotations with their element positions and generate MCP-ready annotations."""
     extracted = []
     mcp_annotations = []
 
-    for i, ann in enumerate(annotations):
+    for i, (ann, bounds) in enumerate(zip(annotations, all_bounds)):
         selector = ann.get("selector", "")
-        bounds = get_element_bounds(page, selector)
-
         ann_type = ann.get("type", "box")
         label = ann.get("label", "")
         position = ann.get("position", "auto")
@@ -402,20 +482,69 @@ def extract_annotations(page, annotations):
                 "bounds": None,
                 "found": False,
             })
-            print(f"    Warning: Element not found: {selector}")
+            print(f"    Warning: {filename}: Element not found: {selector}")
 
     return extracted, mcp_annotations
 
 
+# Per-screenshot JSON files are only written with SCREENSHOT_DEBUG set;
+# they go out on a background thread and are drained by
+# flush_metadata_writes() before the batch file is generated.
+DEBUG_METADATA = bool(os.getenv("SCREENSHOT_DEBUG"))
+io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+PENDING_WRITES = []
+PENDING_OPTIMIZE = []
+
+
+@dataclass
+class CaptureRecord:
+    """One screenshot's Image Annotator MCP command in the batch file."""
+    __slots__ = ("input_path", "output_path", "annotations")
+    input_path: str
+    output_path: str
+    annotations: list
+
+
+def _json_default(obj):
+    """Serialize dataclass records for the stdlib json fallback."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(path, data):
+    """Write data as indented JSON, using orjson when it is installed."""
+    if orjson:
+        # orjson serializes dataclasses natively
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=_json_default)
+
+
 def save_metadata(filename, metadata, mcp_annotations):
-    """Save annotation metadata and MCP-ready commands as JSON."""
+    """Record annotation metadata and the MCP-ready command for the batch file."""
+    ALL_CAPTURES.append(metadata)
+    if mcp_annotations:
+        ALL_MCP_COMMANDS.append(CaptureRecord(
+            input_path=metadata["filepath"],
+            output_path=os.path.join(os.path.abspath(ANNOTATED_DIR), filename),
+            annotations=mcp_annotations,
+        ))
+
+    if DEBUG_METADATA:
+        PENDING_WRITES.append(io_executor.submit(_write_metadata, filename, metadata, mcp_annotations))
+
+
+def _write_metadata(filename, metadata, mcp_annotations):
+    """Write the metadata JSON and, if there are annotations, the MCP command JSON."""
     os.makedirs(METADATA_DIR, exist_ok=True)
 
     # Save original metadata
     json_filename = os.path.splitext(filename)[0] + ".json"
     json_path = os.path.join(METADATA_DIR, json_filename)
-    with open(json_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    write_json(json_path, metadata)
     print(f"    Metadata: {json_path}")
 
     # Save MCP-ready command (can be used directly with Image Annotator MCP)
@@ -431,25 +560,52 @@ def save_metadata(filename, metadata, mcp_annotations):
             "annotations": mcp_annotations,
         }
 
-        with open(mcp_path, 'w') as f:
-            json.dump(mcp_command, f, indent=2)
+        write_json(mcp_path, mcp_command)
         print(f"    MCP Command: {mcp_path}")
 
     return json_path
 
 
-def generate_mcp_batch_file(all_captures):
-    """Generate a batch file with all MCP annotation commands."""
+def optimize_png(filepath):
+    """Queue a lossless oxipng pass over a saved PNG."""
+    if OPTIMIZE_PNGS and OXIPNG:
+        PENDING_OPTIMIZE.append(io_executor.submit(
+            subprocess.run,
+            [OXIPNG, "-o", "2", "--strip", "safe", "--quiet", filepath],
+            check=False,
+        ))
+
+
+def wait_for_optimizations():
+    """Wait for queued PNG optimizations and report any that failed."""
+    for future in concurrent.futures.as_completed(PENDING_OPTIMIZE):
+        if future.exception():
+            print(f"  Warning: oxipng failed: {future.exception()}")
+        elif future.result().returncode:
+            print(f"  Warning: oxipng failed on {future.result().args[-1]}")
+    PENDING_OPTIMIZE.clear()
+
+
+def flush_metadata_writes():
+    """Wait for queued metadata writes and report any that failed."""
+    for future in concurrent.futures.as_completed(PENDING_WRITES):
+        if future.exception():
+            print(f"  Warning: Could not write metadata: {future.exception()}")
+    PENDING_WRITES.clear()
+
+
+def generate_mcp_batch_file(all_commands, all_captures=()):
+    """Generate a batch file with all MCP annotation commands and capture metadata."""
     batch_path = os.path.join(METADATA_DIR, "_batch_annotate.json")
 
     batch = {
         "description": "Batch annotation commands for Image Annotator MCP",
         "output_dir": ANNOTATED_DIR,
-        "commands": all_captures,
+        "commands": all_commands,
+        "captures": list(all_captures),
     }
 
-    with open(batch_path, 'w') as f:
-        json.dump(batch, f, indent=2)
+    write_json(batch_path, batch)
 
     print(f"\n  Batch file: {batch_path}")
     return batch_path
@@ -461,26 +617,31 @@ def generate_mcp_batch_file(all_captures):
 
 # Global tracking for batch processing
 ALL_MCP_COMMANDS = []
+ALL_CAPTURES = []
+NETWORK_IDLE = {}  # page -> asyncio.Event set by CDP networkIdle
 CAPTURE_RESULTS = {"success": [], "failed": [], "skipped": []}
 
 
-def setup_directories():
-    """Create output directories and clear session."""
+def setup_directories(fresh=False):
+    """Create output directories, clearing saved sessions if fresh is set."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     os.makedirs(ANNOTATED_DIR, exist_ok=True)
     os.makedirs(METADATA_DIR, exist_ok=True)
-    if os.path.exists(SESSION_DIR):
+    if fresh and os.path.exists(SESSION_DIR):
         shutil.rmtree(SESSION_DIR)
     os.makedirs(SESSION_DIR, exist_ok=True)
 
     # Reset tracking
     ALL_MCP_COMMANDS.clear()
+    ALL_CAPTURES.clear()
+    PENDING_WRITES.clear()
+    PENDING_OPTIMIZE.clear()
     CAPTURE_RESULTS["success"].clear()
     CAPTURE_RESULTS["failed"].clear()
     CAPTURE_RESULTS["skipped"].clear()
 
 
-def login_as(page, role="admin"):
+async def login_as(page, role="admin"):
     """Login to WordPress using mu-plugin auto-login."""
     role_config = ROLES.get(role, ROLES["admin"])
     user_id = role_config.get('user_id', 1)
@@ -488,11 +649,9 @@ def login_as(page, role="admin"):
     print(f"  Switching to {role} (user ID: {user_id})...")
 
     try:
-        page.goto(f"{SITE_CONFIG['url']}/wp-admin/?dev_login={user_id}")
-        page.wait_for_load_state('networkidle')
-        time.sleep(1)
+        await page.goto(f"{SITE_CONFIG['url']}/wp-admin/?dev_login={user_id}", wait_until='domcontentloaded')
 
-        title = page.title()
+        title = await page.title()
         if "Dashboard" in title or "Profile" in title or "Log In" not in title:
             print(f"    Logged in successfully as {role}")
             return True
@@ -504,47 +663,201 @@ def login_as(page, role="admin"):
         return False
 
 
-def switch_user(page, role):
-    """Switch to a different user role."""
-    return login_as(page, role)
+def state_path(role):
+    """Path of the saved login cookies for a role."""
+    return os.path.join(SESSION_DIR, f"state-{role}.json")
+
+
+def has_fresh_state(role):
+    """Check for saved login cookies younger than SESSION_MAX_AGE."""
+    try:
+        return time.time() - os.path.getmtime(state_path(role)) < SESSION_MAX_AGE
+    except OSError:
+        return False
+
+
+async def block_unneeded_requests(route):
+    """Abort media and tracker requests; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        pattern in request.url for pattern in BLOCKED_URL_PATTERNS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_images(route):
+    """Abort image requests for captures that opt into block_images."""
+    if route.request.resource_type == "image":
+        await route.abort()
+    else:
+        await route.fallback()
+
+
+async def new_context(browser, storage_state=None):
+    """Create a browser context with the standard viewport and request blocking."""
+    context = await browser.new_context(viewport=VIEWPORT, storage_state=storage_state)
+    if BLOCK_REQUESTS:
+        await context.route("**/*", block_unneeded_requests)
+    return context
+
+
+async def save_login_state(browser, role="admin"):
+    """Log in as a role in a throwaway context and save its cookies."""
+    context = await new_context(browser)
+    try:
+        page = await context.new_page()
+        if not await login_as(page, role):
+            return False
+        await context.storage_state(path=state_path(role))
+        return True
+    finally:
+        await context.close()
+
+
+async def get_context_for_role(browser, role):
+    """Return a context logged in as a role, logging in only if no state is saved."""
+    if not has_fresh_state(role) and not await save_login_state(browser, role):
+        return None
+    return await new_context(browser, state_path(role))
+
+
+def role_contexts(browser):
+    """
+    Return a context_for_role(role) coroutine backed by one shared browser.
+
+    Each role gets a single context per run, created on first use; callers
+    asking for the same role concurrently share one login.
+    """
+    contexts = {}
+
+    async def context_for_role(role):
+        if role not in contexts:
+            contexts[role] = asyncio.ensure_future(get_context_for_role(browser, role))
+        return await contexts[role]
+
+    return context_for_role
+
+
+async def create_page_pool(browser, role="admin", size=POOL_SIZE):
+    """
+    Create idle pages that share one browser, each in its own context.
+
+    Every context is seeded from the role's saved login state, so only the
+    first login pays for the dev_login navigation. The pool size also caps
+    how many captures are in flight: borrowers wait until a page is free.
+    """
+    pool = asyncio.Queue()
+    for _ in range(size):
+        context = await new_context(browser, state_path(role))
+        pool.put_nowait(await new_tracked_page(context))
+    return pool
+
+
+@asynccontextmanager
+async def borrow_page(pool):
+    """Take an idle page from the pool and return it when done."""
+    page = await pool.get()
+    try:
+        yield page
+    finally:
+        pool.put_nowait(page)
+
+
+def ready_selector(wait_for=None, annotations=None, default=FRONTEND_WAIT_FOR):
+    """Pick the element that signals a capture is ready to screenshot."""
+    if wait_for:
+        return wait_for
+    if annotations:
+        return annotations[0].get("selector") or default
+    return default
+
+
+async def new_tracked_page(context):
+    """
+    Open a page that reports network idle over CDP.
+
+    One Page.lifecycleEvent subscription per page replaces polling
+    wait_for_load_state('networkidle') after every navigation: the event
+    is cleared when a navigation starts and set when Chromium fires
+    networkIdle for the main frame.
+    """
+    page = await context.new_page()
+    client = await context.new_cdp_session(page)
+    frame_tree = await client.send("Page.getFrameTree")
+    main_frame_id = frame_tree["frameTree"]["frame"]["id"]
+    idle = asyncio.Event()
+
+    def on_lifecycle_event(params):
+        if params["frameId"] != main_frame_id:
+            return
+        if params["name"] == "init":
+            idle.clear()
+        elif params["name"] == "networkIdle":
+            idle.set()
+
+    client.on("Page.lifecycleEvent", on_lifecycle_event)
+    await client.send("Page.enable")
+    await client.send("Page.setLifecycleEventsEnabled", {"enabled": True})
+    NETWORK_IDLE[page] = idle
+    return page
+
+
+async def wait_for_network_idle(page, timeout=NETWORK_IDLE_TIMEOUT):
+    """Wait for the CDP networkIdle signal on a tracked page."""
+    idle = NETWORK_IDLE.get(page)
+    if idle is None:
+        return
+    try:
+        await asyncio.wait_for(idle.wait(), timeout)
+    except asyncio.TimeoutError:
+        print(f"    Warning: {page.url}: Network not idle after {timeout}s, capturing anyway")
 
 
-def click_plugin_tab(page, tab_id, wait_time=WAIT_TIME):
-    """Click a plugin admin tab by its ID."""
+async def wait_for_ready(page, selector, wait_time=WAIT_TIME, network_idle=False, filename=None):
+    """Wait for the capture's ready element instead of a fixed sleep."""
+    try:
+        await page.locator(selector).first.wait_for(state='visible', timeout=READY_TIMEOUT)
+    except Exception:
+        # Captures run concurrently, so say which one this warning belongs to
+        print(f"    Warning: {filename or page.url}: '{selector}' not visible after {READY_TIMEOUT}ms, capturing anyway")
+    if network_idle:
+        await wait_for_network_idle(page)
+    await asyncio.sleep(wait_time)
+
+
+async def click_plugin_tab(page, tab_id, timeout=3000):
+    """Click a plugin admin tab by its ID and wait for it to become active."""
     if tab_id is None:
         return True
 
-    selector = f".nav-tab-wrapper li#{tab_id} a.nav-tab"
+    # click() auto-waits for the tab to be visible and clickable
     try:
-        tab = page.locator(selector)
-        if tab.is_visible():
-            tab.click()
-            time.sleep(wait_time)
-            # Verify tab is now active
-            if "nav-tab-active" in (tab.get_attribute("class") or ""):
-                return True
-            # Fallback: check if click worked by re-checking visibility
-            return True
-        else:
-            print(f"    Warning: Tab '{tab_id}' not visible")
-            return False
+        await page.locator(f".nav-tab-wrapper li#{tab_id} a.nav-tab").click(timeout=timeout)
     except Exception as e:
         print(f"    Warning: Could not click tab '{tab_id}': {e}")
-    return False
+        return False
+
+    try:
+        await page.locator(f".nav-tab-wrapper li#{tab_id} a.nav-tab-active").wait_for(timeout=timeout)
+    except Exception:
+        # Some plugins mark the active tab differently; the click still landed
+        print(f"    Warning: Tab '{tab_id}' clicked but not marked nav-tab-active")
+    return True
 
 
-def capture_screenshot_with_retry(page, filename, full_page=False, annotations=None, max_retries=MAX_RETRIES):
+async def capture_screenshot_with_retry(page, filename, full_page=False, annotations=None, max_retries=MAX_RETRIES):
     """Capture screenshot with automatic retry on failure."""
     for attempt in range(max_retries):
         try:
-            return capture_screenshot(page, filename, full_page, annotations)
+            return await capture_screenshot(page, filename, full_page, annotations)
         except Exception as e:
             print(f"    Attempt {attempt + 1}/{max_retries} failed: {e}")
             if attempt < max_retries - 1:
-                time.sleep(2)
+                await asyncio.sleep(2)
                 try:
-                    page.reload()
-                    page.wait_for_load_state('networkidle')
+                    await page.reload(wait_until='domcontentloaded')
                 except Exception:
                     pass
             else:
@@ -554,62 +867,81 @@ def capture_screenshot_with_retry(page, filename, full_page=False, annotations=N
     return None
 
 
-def capture_screenshot(page, filename, full_page=False, annotations=None):
+def screenshot_options(filename, full_page=False, annotated=False):
+    """Pick the output filename and encoder options for a capture."""
+    if annotated or PLAIN_FORMAT == "png":
+        return filename, {"type": "png", "full_page": full_page}
+    filename = os.path.splitext(filename)[0] + ".jpg"
+    return filename, {"type": "jpeg", "quality": JPEG_QUALITY, "full_page": full_page}
+
+
+def write_file(path, data):
+    """Write bytes straight to a file descriptor, bypassing Python's buffering."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+async def capture_screenshot(page, filename, full_page=False, annotations=None):
     """Capture screenshot and extract annotation metadata."""
+    filename, options = screenshot_options(filename, full_page, bool(annotations))
     filepath = os.path.join(OUTPUT_DIR, filename)
-    page.screenshot(path=filepath, full_page=full_page)
+
+    # Start encoding the screenshot while element bounds are being resolved
+    screenshot_task = asyncio.create_task(page.screenshot(**options))
+    try:
+        # Title and bounds are only recorded for annotated captures
+        title, all_bounds = await read_page_state(page, annotations, filename) if annotations else ("", [])
+    finally:
+        image = await screenshot_task
+    write_file(filepath, image)
     print(f"    Saved: {filepath}")
+    if options["type"] == "png":
+        optimize_png(filepath)
+
+    extracted, mcp_annotations = extract_annotations(annotations or [], all_bounds, filename)
 
-    # Extract and save annotation metadata
+    # Save annotation metadata
     metadata = {
         "filename": filename,
         "filepath": os.path.abspath(filepath),
         "viewport": VIEWPORT,
         "full_page": full_page,
         "url": page.url,
-        "title": page.title(),
-        "annotations": [],
+        "title": title,
+        "annotations": extracted,
     }
 
-    mcp_annotations = []
-
+    # Track for batch processing
     if annotations:
-        extracted, mcp_annotations = extract_annotations(page, annotations)
-        metadata["annotations"] = extracted
         save_metadata(filename, metadata, mcp_annotations)
 
-        # Track for batch processing
-        if mcp_annotations:
-            ALL_MCP_COMMANDS.append({
-                "input_path": os.path.abspath(filepath),
-                "output_path": os.path.join(os.path.abspath(ANNOTATED_DIR), filename),
-                "annotations": mcp_annotations,
-            })
-
     CAPTURE_RESULTS["success"].append(filename)
     return filepath
 
 
-def navigate_and_capture(page, url, filename, full_page=False, wait_time=WAIT_TIME, annotations=None):
+async def navigate_and_capture(page, url, filename, full_page=False, wait_time=WAIT_TIME, annotations=None, wait_for=None, role="admin", network_idle=False):
     """Navigate to URL and capture screenshot with annotations."""
-    current_role = getattr(navigate_and_capture, 'current_role', 'admin')
-    username = ROLES.get(current_role, {}).get('username', '')
+    username = ROLES.get(role, {}).get('username', '')
     url = url.replace('{username}', username)
 
     print(f"  Capturing: {filename}")
 
     try:
-        page.goto(f"{SITE_CONFIG['url']}{url}")
-        page.wait_for_load_state('networkidle')
-        time.sleep(wait_time)
-        return capture_screenshot_with_retry(page, filename, full_page, annotations)
+        await page.goto(f"{SITE_CONFIG['url']}{url}", wait_until='domcontentloaded')
+        await wait_for_ready(page, ready_selector(wait_for, annotations), wait_time, network_idle, filename)
+        return await capture_screenshot_with_retry(page, filename, full_page, annotations)
     except Exception as e:
         print(f"    Navigation failed: {e}")
         CAPTURE_RESULTS["failed"].append(filename)
         return None
 
 
-def set_editor_type(page, editor_type, editor_tab="editor", editor_selector="select[name*='editor']"):
+async def set_editor_type(page, editor_type, editor_tab="editor", editor_selector="select[name*='editor']"):
     """
     Change editor type in plugin settings.
 
@@ -620,19 +952,16 @@ def set_editor_type(page, editor_type, editor_tab="editor", editor_selector="sel
         editor_selector: CSS selector for editor dropdown (default: generic selector)
     """
     print(f"  Setting editor to: {editor_type}")
-    page.goto(f"{SITE_CONFIG['url']}/wp-admin/admin.php?page={SITE_CONFIG['plugin_page']}")
-    page.wait_for_load_state('networkidle')
-    time.sleep(1)
+    await page.goto(f"{SITE_CONFIG['url']}/wp-admin/admin.php?page={SITE_CONFIG['plugin_page']}", wait_until='domcontentloaded')
+    await wait_for_ready(page, ADMIN_WAIT_FOR)
 
     if editor_tab:
-        click_plugin_tab(page, editor_tab)
+        await click_plugin_tab(page, editor_tab)
 
     try:
-        page.select_option(editor_selector, editor_type)
-        time.sleep(0.5)
-        page.locator("input[type='submit']").click()
-        page.wait_for_load_state('networkidle')
-        time.sleep(1)
+        await page.select_option(editor_selector, editor_type)
+        async with page.expect_navigation(wait_until='domcontentloaded'):
+            await page.locator("input[type='submit']").click()
         print(f"    Editor set to: {editor_type}")
         return True
     except Exception as e:
@@ -644,60 +973,97 @@ def set_editor_type(page, editor_type, editor_tab="editor", editor_selector="sel
 # MAIN CAPTURE WORKFLOW
 # =============================================================================
 
-def capture_admin_tabs(page):
+async def capture_admin_tabs(pool):
     """Capture admin tab screenshots with annotations."""
     if not ADMIN_TABS:
         return
 
     print("\n=== Admin Tab Screenshots ===\n")
 
+    # Captures of the same tab share one page load and one tab click
+    tab_groups = {}
+    for capture in ADMIN_TABS:
+        tab_groups.setdefault(capture.get('tab'), []).append(capture)
+
+    await asyncio.gather(*(
+        capture_admin_tab(pool, tab_id, captures) for tab_id, captures in tab_groups.items()
+    ))
+
+
+async def capture_admin_tab(pool, tab_id, captures):
+    """Load the plugin settings page on a free page and capture one tab."""
+    # Only skip images when every capture of this tab agrees to it
+    no_images = all(capture.get('block_images') for capture in captures)
+
+    async with borrow_page(pool) as page:
+        if no_images:
+            await page.route("**/*", block_images)
+        try:
+            await _capture_admin_tab(page, tab_id, captures)
+        finally:
+            if no_images:
+                await page.unroute("**/*", block_images)
+
+
+async def _capture_admin_tab(page, tab_id, captures):
+    """Open the settings page, click the tab once and screenshot each capture."""
+    filenames = [capture['filename'] for capture in captures]
+
     try:
-        page.goto(f"{SITE_CONFIG['url']}/wp-admin/admin.php?page={SITE_CONFIG['plugin_page']}")
-        page.wait_for_load_state('networkidle')
-        time.sleep(WAIT_TIME)
+        await page.goto(f"{SITE_CONFIG['url']}/wp-admin/admin.php?page={SITE_CONFIG['plugin_page']}", wait_until='domcontentloaded')
+        await wait_for_ready(page, ADMIN_WAIT_FOR)
     except Exception as e:
-        print(f"  ERROR: Could not load admin page: {e}")
+        print(f"  ERROR: Could not load admin page for tab '{tab_id}': {e}")
+        CAPTURE_RESULTS["failed"].extend(filenames)
         return
 
-    for capture in ADMIN_TABS:
-        filename = capture['filename']
-        tab_id = capture.get('tab')
-
-        print(f"  Capturing: {filename}")
-
-        # Verify tab click succeeded before capturing
-        if tab_id is not None:
-            if not click_plugin_tab(page, tab_id):
-                print(f"    SKIPPED: Tab '{tab_id}' click failed for {filename}")
-                CAPTURE_RESULTS["skipped"].append(filename)
-                continue
+    # Verify tab click succeeded before capturing
+    if tab_id is not None and not await click_plugin_tab(page, tab_id):
+        print(f"    SKIPPED: Tab '{tab_id}' click failed for {', '.join(filenames)}")
+        CAPTURE_RESULTS["skipped"].extend(filenames)
+        return
 
-        capture_screenshot_with_retry(
+    for capture in captures:
+        print(f"  Capturing: {capture['filename']}")
+        await wait_for_ready(
             page,
-            filename,
+            ready_selector(capture.get('wait_for'), capture.get('annotations'), ADMIN_WAIT_FOR),
+            network_idle=capture.get('network_idle', False),
+            filename=capture['filename']
+        )
+        await capture_screenshot_with_retry(
+            page,
+            capture['filename'],
             capture.get('full_page', False),
             capture.get('annotations', [])
         )
 
 
-def capture_frontend_pages(page):
+async def capture_frontend_pages(pool):
     """Capture frontend screenshots with annotations."""
     if not FRONTEND_PAGES:
         return
 
     print("\n=== Frontend Screenshots ===\n")
-    for capture in FRONTEND_PAGES:
-        navigate_and_capture(
+    await asyncio.gather(*(capture_frontend_page(pool, capture) for capture in FRONTEND_PAGES))
+
+
+async def capture_frontend_page(pool, capture):
+    """Capture one frontend page on a free page."""
+    async with borrow_page(pool) as page:
+        await navigate_and_capture(
             page,
             capture['url'],
             capture['filename'],
             capture.get('full_page', False),
             WAIT_TIME,
-            capture.get('annotations', [])
+            capture.get('annotations', []),
+            capture.get('wait_for'),
+            network_idle=capture.get('network_idle', False)
         )
 
 
-def capture_editor_variations(page):
+async def capture_editor_variations(pool):
     """Capture editor type screenshots with annotations."""
     if not EDITOR_TYPES:
         return
@@ -709,37 +1075,58 @@ def capture_editor_variations(page):
     editor_selector = EDITOR_CONFIG.get("selector", "select[name*='editor']")
     form_url = EDITOR_CONFIG.get("form_url", "/add-new-post/")
 
-    for editor in EDITOR_TYPES:
-        print(f"\n--- {editor['type']} editor ---")
-        set_editor_type(page, editor['type'], editor_tab, editor_selector)
-        navigate_and_capture(
-            page,
-            form_url,
-            editor['filename'],
-            full_page=True,
-            annotations=editor.get('annotations', [])
-        )
+    # Editor type is a site-wide setting, so variations must run one at a time
+    async with borrow_page(pool) as page:
+        for editor in EDITOR_TYPES:
+            print(f"\n--- {editor['type']} editor ---")
+            await set_editor_type(page, editor['type'], editor_tab, editor_selector)
+            await navigate_and_capture(
+                page,
+                form_url,
+                editor['filename'],
+                full_page=True,
+                annotations=editor.get('annotations', []),
+                wait_for=editor.get('wait_for'),
+                network_idle=editor.get('network_idle', False)
+            )
 
 
-def capture_role_comparisons(page):
-    """Capture role-based screenshots."""
+async def capture_role_comparisons(context_for_role):
+    """Capture role-based screenshots, with each role in its own context."""
     if not ROLE_CAPTURES:
         return
 
     print("\n=== Role Comparison Screenshots ===\n")
-    for capture in ROLE_CAPTURES:
-        for role in capture['roles']:
-            print(f"\n--- As {role} ---")
-            if switch_user(page, role):
-                navigate_and_capture.current_role = role
-                filename = capture['filename_pattern'].format(role=role)
-                navigate_and_capture(
-                    page,
-                    capture['url'],
-                    filename,
-                    capture.get('full_page', False),
-                    annotations=capture.get('annotations', [])
-                )
+    roles = dict.fromkeys(role for capture in ROLE_CAPTURES for role in capture['roles'])
+    await asyncio.gather(*(capture_as_role(context_for_role, role) for role in roles))
+
+
+async def capture_as_role(context_for_role, role):
+    """Capture every role comparison that includes this role."""
+    context = await context_for_role(role)
+    if context is None:
+        return
+
+    print(f"\n--- As {role} ---")
+    page = await new_tracked_page(context)
+    try:
+        for capture in ROLE_CAPTURES:
+            if role not in capture['roles']:
+                continue
+            filename = capture['filename_pattern'].format(role=role)
+            await navigate_and_capture(
+                page,
+                capture['url'],
+                filename,
+                capture.get('full_page', False),
+                annotations=capture.get('annotations', []),
+                wait_for=capture.get('wait_for'),
+                role=role,
+                network_idle=capture.get('network_idle', False)
+            )
+    finally:
+        NETWORK_IDLE.pop(page, None)
+        await page.close()
 
 
 def cleanup_metadata():
@@ -778,12 +1165,14 @@ def print_annotation_summary():
     print("ANNOTATION SUMMARY")
     print("="*60)
 
+    flush_metadata_writes()
+
     if not ALL_MCP_COMMANDS:
         print("\nNo annotations to process.")
         return
 
     # Generate batch file for MCP processing
-    generate_mcp_batch_file(ALL_MCP_COMMANDS)
+    generate_mcp_batch_file(ALL_MCP_COMMANDS, ALL_CAPTURES)
 
     print(f"\nFound {len(ALL_MCP_COMMANDS)} screenshots with annotations.")
     print(f"\nMetadata (temp): {METADATA_DIR}/")
@@ -797,7 +1186,7 @@ Option 1 - Batch annotation (recommended):
   Load {METADATA_DIR}/_batch_annotate.json and process all at once.
 
 Option 2 - Individual annotation:
-  For each *_mcp.json file in {METADATA_DIR}/, use:
+  For each entry in "commands" of the batch file, use:
   annotate_screenshot(input_path, output_path, annotations)
 
 After annotation is complete:
@@ -805,9 +1194,44 @@ After annotation is complete:
 """)
 
 
+async def run_captures(headless=HEADLESS):
+    """Log in once, then run every capture phase against the page pool."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless, args=BROWSER_ARGS)
+
+        print("\n=== Logging in ===\n")
+        # Save cookies once; pool contexts start already logged in
+        if has_fresh_state("admin"):
+            print(f"  Reusing saved admin login: {state_path('admin')}")
+        elif not await save_login_state(browser, "admin"):
+            print("\n  FATAL: Login failed. Aborting capture.")
+            await browser.close()
+            return False
+
+        pool = await create_page_pool(browser)
+
+        # Phases run in order; captures within a phase run concurrently
+        await capture_admin_tabs(pool)
+        await capture_frontend_pages(pool)
+        await capture_editor_variations(pool)
+        await capture_role_comparisons(role_contexts(browser))
+
+        await browser.close()
+    return True
+
+
 def main():
     """Main capture workflow."""
-    setup_directories()
+    global OPTIMIZE_PNGS
+
+    parser = argparse.ArgumentParser(description="Capture WordPress documentation screenshots")
+    parser.add_argument("--fresh", action="store_true", help="Discard saved logins and log in again")
+    parser.add_argument("--headful", action="store_true", help="Show the browser window")
+    parser.add_argument("--no-optimize", action="store_true", help="Skip the oxipng pass over saved PNGs")
+    args = parser.parse_args()
+    OPTIMIZE_PNGS = OPTIMIZE_PNGS and not args.no_optimize
+
+    setup_directories(fresh=args.fresh)
 
     print("\n" + "="*60)
     print("WordPress Documentation Screenshot Capture")
@@ -821,34 +1245,15 @@ def main():
     print("="*60)
 
     try:
-        with sync_playwright() as p:
-            context = p.chromium.launch_persistent_context(
-                SESSION_DIR,
-                headless=HEADLESS,
-                viewport=VIEWPORT
-            )
-            page = context.pages[0] if context.pages else context.new_page()
-
-            print("\n=== Logging in ===\n")
-            if not login_as(page, "admin"):
-                print("\n  FATAL: Login failed. Aborting capture.")
-                context.close()
-                return 1
-
-            navigate_and_capture.current_role = "admin"
-
-            # Run capture sequences
-            capture_admin_tabs(page)
-            capture_frontend_pages(page)
-            capture_editor_variations(page)
-            capture_role_comparisons(page)
-
-            context.close()
-
+        if not asyncio.run(run_captures(headless=HEADLESS and not args.headful)):
+            return 1
     except Exception as e:
         print(f"\n  FATAL ERROR: {e}")
         return 1
 
+    # PNGs must be final before the annotator reads them
+    wait_for_optimizations()
+
     # Print summaries
     print_capture_summary()
     print_annotation_summary()
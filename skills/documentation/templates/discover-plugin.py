@@ -13,144 +13,210 @@ Prerequisites:
     2. pip install playwright && playwright install chromium
 """
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, expect, TimeoutError as PlaywrightTimeoutError
 import argparse
+import asyncio
 import json
 import os
-import time
+import re
 
-def discover_admin_tabs(page):
+# Element present on every rendered wp-admin screen
+WAIT_TARGET = "#wpbody-content"
+VIEWPORT = {"width": 1680, "height": 1100}
+TAB_CONCURRENCY = 6  # Tabs scraped at once, each in its own browser context
+
+
+async def wait_for_page(page, timeout=10000):
+    """Wait for wp-admin content instead of networkidle; False if it never appears."""
+    try:
+        await page.wait_for_selector(WAIT_TARGET, state='attached', timeout=timeout)
+        await page.wait_for_function("document.readyState === 'complete'", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+# Common tab wrapper selectors (ordered by specificity)
+TAB_SELECTORS = [
+    ".nav-tab-wrapper ul li a.nav-tab",        # Wbcom style (ul > li > a)
+    ".nav-tab-wrapper li a.nav-tab",           # Wbcom style (li > a)
+    ".nav-tab-wrapper a.nav-tab",              # Standard WP style
+    ".wp-tab-bar li a",                        # WP tab bar
+    ".settings-tabs li a",                     # Generic settings tabs
+    "[role='tablist'] [role='tab']",           # ARIA tabs
+    ".nav-tab",                                # Fallback - any nav-tab
+]
+
+# Probes every tab selector in the browser and returns the raw attributes
+# of each match, so discovery costs one round-trip instead of one per element
+TAB_PROBE_JS = """(selectors) => selectors.map((selector) => {
+    let els = [];
+    try {
+        els = [...document.querySelectorAll(selector)];
+    } catch (e) {}
+    return {
+        selector,
+        tabs: els.map((e) => ({
+            name: e.textContent.trim(),
+            href: e.getAttribute('href') || '',
+            parentId: (e.parentElement && e.parentElement.id) || '',
+            id: e.id || '',
+            active: e.classList.contains('nav-tab-active'),
+        })),
+    };
+})"""
+
+
+def tab_id_from(raw):
+    """Pick a tab ID: parent li ID, then href tab= or #fragment, then own ID."""
+    if raw["parentId"]:
+        return raw["parentId"]
+    href = raw["href"]
+    if "tab=" in href:
+        return href.split("tab=")[-1].split("&")[0]
+    if "#" in href:
+        return href.split("#")[-1]
+    return raw["id"]
+
+
+async def discover_admin_tabs(page):
     """Discover all admin tabs in the plugin settings page."""
-    tabs = []
-
-    # Common tab wrapper selectors (ordered by specificity)
-    tab_selectors = [
-        ".nav-tab-wrapper ul li a.nav-tab",        # Wbcom style (ul > li > a)
-        ".nav-tab-wrapper li a.nav-tab",           # Wbcom style (li > a)
-        ".nav-tab-wrapper a.nav-tab",              # Standard WP style
-        ".wp-tab-bar li a",                        # WP tab bar
-        ".settings-tabs li a",                     # Generic settings tabs
-        "[role='tablist'] [role='tab']",           # ARIA tabs
-        ".nav-tab",                                # Fallback - any nav-tab
-    ]
-
-    for selector in tab_selectors:
+    try:
+        matches = await page.evaluate(TAB_PROBE_JS, TAB_SELECTORS)
+    except Exception as e:
+        print(f"    Error probing tabs: {e}")
+        return []
+
+    for match in matches:
+        selector = match["selector"]
+        print(f"    Trying: {selector} → {len(match['tabs'])} matches")
+
+        tabs = []
+        for raw in match["tabs"]:
+            tab_id = tab_id_from(raw)
+            # Avoid duplicates
+            if raw["name"] and tab_id and not any(t["id"] == tab_id for t in tabs):
+                tabs.append({
+                    "id": tab_id,
+                    "name": raw["name"],
+                    "selector": selector,
+                    "active": raw["active"],
+                })
+
+        if tabs:
+            print(f"    ✓ Found {len(tabs)} tabs using: {selector}")
+            return tabs
+
+    return []
+
+
+# Walks the DOM in the browser so a whole tab is scraped in one round-trip
+FORM_ELEMENTS_JS = """() => {
+    const dropdowns = [...document.querySelectorAll('select')]
+        .slice(0, 30)
+        .filter((s) => s.id || s.name)
+        .map((s) => ({
+            id: s.id,
+            name: s.name,
+            options: [...s.options]
+                .filter((o) => o.getAttribute('value'))
+                .slice(0, 10)
+                .map((o) => ({value: o.value, text: o.textContent.trim()})),
+        }));
+    const checkboxes = [...document.querySelectorAll("input[type='checkbox']")]
+        .slice(0, 20)
+        .filter((c) => c.id || c.name)
+        .map((c) => ({id: c.id, name: c.name}));
+    const buttons = [...document.querySelectorAll("input[type='submit'], button[type='submit']")]
+        .slice(0, 5)
+        .map((b) => ({id: b.id, text: (b.getAttribute('value') || b.textContent || '').trim()}));
+    return {dropdowns, checkboxes, text_inputs: [], textareas: [], buttons};
+}"""
+
+
+async def discover_form_elements(page):
+    """Discover form elements on the current page."""
+    try:
+        return await page.evaluate(FORM_ELEMENTS_JS)
+    except Exception as e:
+        print(f"    Error reading form elements: {e}")
+        return {
+            "dropdowns": [],
+            "checkboxes": [],
+            "text_inputs": [],
+            "textareas": [],
+            "buttons": [],
+        }
+
+
+async def scrape_tab(browser, state, url, admin_page, tab, limit):
+    """Load one tab in its own logged-in context and discover its form elements."""
+    async with limit:
+        context = await browser.new_context(storage_state=state, viewport=VIEWPORT)
         try:
-            elements = page.locator(selector).all()
-            print(f"    Trying: {selector} → {len(elements)} matches")
-
-            if elements:
-                for el in elements:
-                    tab_id = None
-                    tab_name = el.text_content().strip()
-
-                    # Try to get tab ID from parent li
-                    try:
-                        parent = el.locator("xpath=..")
-                        parent_id = parent.get_attribute("id")
-                        if parent_id:
-                            tab_id = parent_id
-                    except:
-                        pass
-
-                    # Try href parameter
-                    if not tab_id:
-                        href = el.get_attribute("href") or ""
-                        if "tab=" in href:
-                            tab_id = href.split("tab=")[-1].split("&")[0]
-                        elif "#" in href:
-                            tab_id = href.split("#")[-1]
-
-                    # Try element's own ID
-                    if not tab_id:
-                        tab_id = el.get_attribute("id")
-
-                    if tab_name and tab_id:
-                        # Avoid duplicates
-                        if not any(t["id"] == tab_id for t in tabs):
-                            tabs.append({
-                                "id": tab_id,
-                                "name": tab_name,
-                                "selector": selector,
-                            })
-
-                if tabs:
-                    print(f"    ✓ Found {len(tabs)} tabs using: {selector}")
-                    break
+            page = await context.new_page()
+            await page.goto(f"{url}/wp-admin/admin.php?page={admin_page}&tab={tab['id']}", wait_until='domcontentloaded')
+            if not await wait_for_page(page):
+                print(f"    Could not load tab: {tab['id']} (wp-admin content never appeared)")
+                return tab["id"], None
+
+            # JavaScript tabs ignore ?tab=, so click the tab if it isn't active yet
+            tab_link = page.locator(f".nav-tab-wrapper li#{tab['id']} a.nav-tab")
+            if await tab_link.count() and "nav-tab-active" not in (await tab_link.get_attribute("class") or ""):
+                try:
+                    await tab_link.click()
+                    await expect(tab_link).to_have_class(re.compile("nav-tab-active"))
+                except Exception as e:
+                    # Scraping whatever tab is showing would file its elements under the wrong ID
+                    print(f"    Could not switch to tab: {tab['id']} ({e})")
+                    return tab["id"], None
+
+            return tab["id"], await discover_form_elements(page)
         except Exception as e:
-            print(f"    Error with {selector}: {e}")
-            continue
+            print(f"    Could not load tab: {tab['id']} ({e})")
+            return tab["id"], None
+        finally:
+            await context.close()
 
-    return tabs
 
+def print_editor_dropdowns(elements):
+    """Print any editor dropdown found among a tab's form elements."""
+    for dd in elements["dropdowns"]:
+        if "editor" in dd["id"].lower() or "editor" in dd["name"].lower():
+            print(f"    >> EDITOR FOUND: #{dd['id']} ({len(dd['options'])} options)")
+            for opt in dd["options"]:
+                print(f"       - {opt['value']}: {opt['text']}")
 
-def discover_form_elements(page):
-    """Discover form elements on the current page."""
-    elements = {
-        "dropdowns": [],
-        "checkboxes": [],
-        "text_inputs": [],
-        "textareas": [],
-        "buttons": [],
-    }
 
-    # Dropdowns
-    try:
-        selects = page.locator("select").all()
-        for sel in selects:
-            sel_id = sel.get_attribute("id") or ""
-            sel_name = sel.get_attribute("name") or ""
-            options = []
-            try:
-                opts = sel.locator("option").all()
-                for opt in opts:
-                    val = opt.get_attribute("value")
-                    text = opt.text_content().strip()
-                    if val:
-                        options.append({"value": val, "text": text})
-            except:
-                pass
-
-            if sel_id or sel_name:
-                elements["dropdowns"].append({
-                    "id": sel_id,
-                    "name": sel_name,
-                    "options": options[:10],  # Limit to 10
-                })
-    except:
-        pass
+def session_state_path(admin_page, user_id):
+    """Where the login cookies for this plugin and user are cached between runs."""
+    return f"/tmp/wp-session-{admin_page}-{user_id}.json"
 
-    # Checkboxes
-    try:
-        checks = page.locator("input[type='checkbox']").all()
-        for chk in checks[:20]:  # Limit
-            chk_id = chk.get_attribute("id") or ""
-            chk_name = chk.get_attribute("name") or ""
-            if chk_id or chk_name:
-                elements["checkboxes"].append({
-                    "id": chk_id,
-                    "name": chk_name,
-                })
-    except:
-        pass
 
-    # Submit buttons
-    try:
-        btns = page.locator("input[type='submit'], button[type='submit']").all()
-        for btn in btns[:5]:
-            btn_val = btn.get_attribute("value") or btn.text_content() or ""
-            btn_id = btn.get_attribute("id") or ""
-            elements["buttons"].append({
-                "id": btn_id,
-                "text": btn_val.strip(),
-            })
-    except:
-        pass
+async def login(page, url, user_id):
+    """Log in through the dev_login mu-plugin; False if WordPress shows the login form."""
+    print(f"\n--- Logging in as user {user_id} ---")
+    await page.goto(f"{url}/wp-admin/?dev_login={user_id}", wait_until='domcontentloaded')
+
+    # A rejected dev_login redirects to wp-login.php; fail there instead of waiting out the timeout
+    if "wp-login.php" in page.url or not await wait_for_page(page):
+        print("ERROR: Login failed. Check mu-plugin installation.")
+        return False
 
-    return elements
+    print("Logged in successfully!")
+    return True
 
 
-def discover_plugin_structure(url, admin_page, user_id=1):
+async def load_plugin_page(page, url, admin_page):
+    """Open the plugin's settings page and wait for it to render."""
+    await page.goto(f"{url}/wp-admin/admin.php?page={admin_page}", wait_until='domcontentloaded')
+    # Expired cookies land on wp-login.php, which never renders WAIT_TARGET
+    if "wp-login.php" in page.url:
+        return
+    await wait_for_page(page)
+
+
+async def discover_plugin_structure(url, admin_page, user_id=1, headful=False):
     """Discover the complete plugin admin structure."""
 
     print(f"\n{'='*60}")
@@ -166,39 +232,45 @@ def discover_plugin_structure(url, admin_page, user_id=1):
         "tab_details": {},
     }
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(viewport={"width": 1680, "height": 1100})
-        page = context.new_page()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=not headful)
 
-        # Login
-        print(f"\n--- Logging in as user {user_id} ---")
-        page.goto(f"{url}/wp-admin/?dev_login={user_id}")
-        page.wait_for_load_state('networkidle')
-        time.sleep(1)
+        # Reuse cookies from an earlier run to skip the dev_login round-trip
+        state_path = session_state_path(admin_page, user_id)
+        saved = os.path.exists(state_path)
+        context = await browser.new_context(storage_state=state_path if saved else None, viewport=VIEWPORT)
+        page = await context.new_page()
 
-        if "Dashboard" not in page.title() and "Log In" in page.title():
-            print("ERROR: Login failed. Check mu-plugin installation.")
-            browser.close()
+        if saved:
+            print(f"\n--- Reusing saved login: {state_path} ---")
+        elif await login(page, url, user_id):
+            await context.storage_state(path=state_path)
+        else:
+            await browser.close()
             return None
 
-        print("Logged in successfully!")
-
         # Navigate to plugin page
         print(f"\n--- Loading plugin page ---")
-        page.goto(f"{url}/wp-admin/admin.php?page={admin_page}")
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
+        await load_plugin_page(page, url, admin_page)
+
+        # Saved cookies may have expired since the last run
+        if saved and "wp-login.php" in page.url:
+            print("Saved login expired.")
+            if not await login(page, url, user_id):
+                await browser.close()
+                return None
+            await context.storage_state(path=state_path)
+            await load_plugin_page(page, url, admin_page)
 
         # Check if page loaded
         if "page=" not in page.url:
             print(f"ERROR: Plugin page not found. Check slug: {admin_page}")
-            browser.close()
+            await browser.close()
             return None
 
         # Discover tabs
         print(f"\n--- Discovering tabs ---")
-        tabs = discover_admin_tabs(page)
+        tabs = await discover_admin_tabs(page)
         structure["tabs"] = tabs
 
         if tabs:
@@ -211,46 +283,40 @@ def discover_plugin_structure(url, admin_page, user_id=1):
         # Discover elements on each tab
         print(f"\n--- Analyzing each tab ---")
 
+        # The plugin page is already showing its default tab, so scrape it here
+        initial_elements = await discover_form_elements(page)
+
         if tabs:
-            for tab in tabs:
-                print(f"\n  Tab: {tab['name']} ({tab['id']})")
+            # Every other tab loads in parallel, sharing the login cookies
+            state = await context.storage_state()
+            limit = asyncio.Semaphore(TAB_CONCURRENCY)
+            results = dict(await asyncio.gather(*(
+                scrape_tab(browser, state, url, admin_page, tab, limit)
+                for tab in tabs if not tab["active"]
+            )))
 
-                # Click tab
-                try:
-                    tab_selector = f".nav-tab-wrapper li#{tab['id']} a.nav-tab"
-                    page.locator(tab_selector).click()
-                    time.sleep(1)
-                except:
-                    try:
-                        page.goto(f"{url}/wp-admin/admin.php?page={admin_page}&tab={tab['id']}")
-                        page.wait_for_load_state('networkidle')
-                        time.sleep(1)
-                    except:
-                        print(f"    Could not load tab: {tab['id']}")
-                        continue
-
-                # Discover form elements
-                elements = discover_form_elements(page)
-                structure["tab_details"][tab["id"]] = elements
+            for tab in tabs:
+                tab_id = tab["id"]
+                elements = initial_elements if tab["active"] else results[tab_id]
+                if elements is None:
+                    continue
+                structure["tab_details"][tab_id] = elements
 
                 # Summary
+                print(f"\n  Tab: {tab['name']} ({tab_id})")
                 print(f"    Dropdowns: {len(elements['dropdowns'])}")
                 print(f"    Checkboxes: {len(elements['checkboxes'])}")
 
                 # Check for editor dropdown
-                for dd in elements["dropdowns"]:
-                    if "editor" in dd["id"].lower() or "editor" in dd["name"].lower():
-                        print(f"    >> EDITOR FOUND: #{dd['id']} ({len(dd['options'])} options)")
-                        for opt in dd["options"]:
-                            print(f"       - {opt['value']}: {opt['text']}")
+                print_editor_dropdowns(elements)
         else:
-            # Single page - discover all elements
-            elements = discover_form_elements(page)
+            # Single page - the initial scrape covers everything
+            elements = initial_elements
             structure["tab_details"]["main"] = elements
             print(f"  Dropdowns: {len(elements['dropdowns'])}")
             print(f"  Checkboxes: {len(elements['checkboxes'])}")
 
-        browser.close()
+        await browser.close()
 
     return structure
 
@@ -293,10 +359,10 @@ def generate_capture_config(structure):
 def print_capture_script(config, plugin_path):
     """Print a ready-to-use capture script."""
 
-    tabs_code = "ADMIN_TABS = [\n"
-    for tab in config["ADMIN_TABS"]:
-        tabs_code += f'    {{"id": "{tab["id"]}", "name": "{tab["name"]}", "file": "{tab["file"]}"}},\n'
-    tabs_code += "]"
+    tabs_code = "ADMIN_TABS = [\n" + "".join(
+        f'    {{"id": "{tab["id"]}", "name": "{tab["name"]}", "file": "{tab["file"]}"}},\n'
+        for tab in config["ADMIN_TABS"]
+    ) + "]"
 
     editor_code = "EDITOR_CONFIG = None  # No editor dropdown found"
     editor_types = ""
@@ -310,21 +376,22 @@ def print_capture_script(config, plugin_path):
 }}'''
 
         if ec["options"]:
-            editor_types = "\nEDITOR_TYPES = [\n"
-            for opt in ec["options"]:
-                editor_types += f'    {{"type": "{opt}", "filename": "frontend-form-{opt}.png"}},\n'
-            editor_types += "]"
+            editor_types = "\nEDITOR_TYPES = [\n" + "".join(
+                f'    {{"type": "{opt}", "filename": "frontend-form-{opt}.png"}},\n'
+                for opt in ec["options"]
+            ) + "]"
 
     script = f'''#!/usr/bin/env python3
 """
 Screenshot Capture Script for {config["SITE_CONFIG"]["plugin_slug"]}
 Auto-generated by discover-plugin.py
 
-Usage: python3 capture-screenshots.py
+Usage: python3 capture-screenshots.py [--headful]
 """
 
-from playwright.sync_api import sync_playwright
-import time
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+import argparse
+import asyncio
 import os
 import json
 
@@ -341,8 +408,10 @@ SITE_CONFIG = {{
 ADMIN_USER_ID = 1
 IMAGES_DIR = f"{{SITE_CONFIG['plugin_path']}}/docs/images"
 METADATA_DIR = f"/tmp/screenshot-metadata-{{SITE_CONFIG['plugin_slug']}}"
-SESSION_DIR = "/tmp/playwright-wp-session"
 VIEWPORT = {{"width": 1680, "height": 1100}}
+WAIT_TARGET = "#wpbody-content"  # Present on every rendered wp-admin screen
+TAB_CONCURRENCY = 4  # Admin tabs captured at once, each in its own browser context
+HEADLESS = True  # Pass --headful to watch the browser while debugging
 
 # =============================================================================
 # ADMIN TABS
@@ -372,82 +441,112 @@ FRONTEND_PAGES = [
 def ensure_dirs():
     os.makedirs(IMAGES_DIR, exist_ok=True)
     os.makedirs(METADATA_DIR, exist_ok=True)
-    if os.path.exists(SESSION_DIR):
-        import shutil
-        shutil.rmtree(SESSION_DIR)
-    os.makedirs(SESSION_DIR, exist_ok=True)
 
 
-def click_tab(page, tab_id, wait=2):
-    """Click a plugin admin tab."""
-    selector = f".nav-tab-wrapper li#{{tab_id}} a.nav-tab"
+async def wait_for_page(page, target=WAIT_TARGET, timeout=10000):
+    """Wait for the page's main content instead of networkidle."""
     try:
-        tab = page.locator(selector)
-        if tab.is_visible():
-            tab.click()
-            time.sleep(wait)
-            return True
-    except:
-        pass
-    return False
+        await page.wait_for_selector(target, state='attached', timeout=timeout)
+        await page.wait_for_function("document.readyState === 'complete'", timeout=timeout)
+    except PlaywrightTimeoutError:
+        print(f"    Warning: {{target}} not found, capturing anyway")
+
+
+async def click_tab(page, tab_id, timeout=5000):
+    """Click a plugin admin tab and wait for it to become active."""
+    tab = page.locator(f".nav-tab-wrapper li#{{tab_id}} a.nav-tab")
+    if not await tab.count() or not await tab.is_visible():
+        return False
+    await tab.click()
+    try:
+        await page.wait_for_selector(f".nav-tab-wrapper li#{{tab_id}} a.nav-tab-active", timeout=timeout)
+    except PlaywrightTimeoutError:
+        print(f"    Warning: tab {{tab_id}} never became active")
+    return True
 
 
-def capture(page, filename, full_page=False):
+async def capture(page, filename, full_page=False):
     """Capture screenshot."""
     filepath = os.path.join(IMAGES_DIR, filename)
-    page.screenshot(path=filepath, full_page=full_page)
+    await page.screenshot(path=filepath, full_page=full_page)
     print(f"  Saved: {{filepath}}")
     return filepath
 
 
-def main():
+async def capture_tab(browser, state, tab, limit):
+    """Load one admin tab in its own logged-in context and screenshot it."""
+    url = SITE_CONFIG["url"]
+    slug = SITE_CONFIG["plugin_slug"]
+
+    async with limit:
+        context = await browser.new_context(storage_state=state, viewport=VIEWPORT)
+        try:
+            page = await context.new_page()
+            await page.goto(f"{{url}}/wp-admin/admin.php?page={{slug}}&tab={{tab['id']}}", wait_until='domcontentloaded')
+            await wait_for_page(page)
+
+            # JavaScript tabs ignore ?tab=, so click the tab if it isn't active yet
+            tab_link = page.locator(f".nav-tab-wrapper li#{{tab['id']}} a.nav-tab")
+            if not await tab_link.count():
+                print(f"    SKIP: Tab {{tab['id']}} not found")
+                return None
+            if "nav-tab-active" not in (await tab_link.get_attribute("class") or ""):
+                await tab_link.click()
+            # Wait on this tab specifically; a bare .nav-tab-active matches the old tab too
+            await page.wait_for_selector(f".nav-tab-wrapper li#{{tab['id']}} a.nav-tab-active", timeout=10000)
+
+            print(f"  Tab: {{tab['name']}}")
+            return await capture(page, tab["file"])
+        except Exception as e:
+            print(f"    Error on tab {{tab['id']}}: {{e}}")
+            return None
+        finally:
+            await context.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Capture plugin documentation screenshots")
+    parser.add_argument("--headful", action="store_true", help="Show the browser window")
+    args = parser.parse_args()
+
     ensure_dirs()
     url = SITE_CONFIG["url"]
     slug = SITE_CONFIG["plugin_slug"]
 
     print(f"\\n=== Capturing {{slug}} Screenshots ===\\n")
 
-    with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(
-            SESSION_DIR, headless=False, viewport=VIEWPORT
-        )
-        page = context.pages[0] if context.pages else context.new_page()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=HEADLESS and not args.headful)
+        context = await browser.new_context(viewport=VIEWPORT)
+        page = await context.new_page()
 
-        # Login
+        # Login once; every tab context starts from these cookies
         print("Logging in...")
-        page.goto(f"{{url}}/wp-admin/?dev_login={{ADMIN_USER_ID}}")
-        page.wait_for_load_state('networkidle')
-        time.sleep(1)
+        await page.goto(f"{{url}}/wp-admin/?dev_login={{ADMIN_USER_ID}}", wait_until='domcontentloaded')
+        await wait_for_page(page)
+        state = await context.storage_state()
 
         # Admin tabs
         print("\\n--- Admin Screenshots ---\\n")
-        page.goto(f"{{url}}/wp-admin/admin.php?page={{slug}}")
-        page.wait_for_load_state('networkidle')
-        time.sleep(2)
-
-        for tab in ADMIN_TABS:
-            print(f"  Tab: {{tab['name']}}")
-            if click_tab(page, tab["id"]):
-                capture(page, tab["file"])
-            else:
-                print(f"    SKIP: Tab {{tab['id']}} not found")
+        limit = asyncio.Semaphore(TAB_CONCURRENCY)
+        await asyncio.gather(*(capture_tab(browser, state, tab, limit) for tab in ADMIN_TABS))
 
         # Editor variations
-        if EDITOR_CONFIG and 'EDITOR_TYPES' in dir():
+        # EDITOR_TYPES is only emitted when options were found; dir() here would list locals
+        if EDITOR_CONFIG and "EDITOR_TYPES" in globals():
             print("\\n--- Editor Screenshots ---\\n")
             for editor in EDITOR_TYPES:
                 print(f"  Editor: {{editor['type']}}")
-                page.goto(f"{{url}}/wp-admin/admin.php?page={{slug}}")
-                page.wait_for_load_state('networkidle')
-                click_tab(page, EDITOR_CONFIG["tab"])
+                await page.goto(f"{{url}}/wp-admin/admin.php?page={{slug}}", wait_until='domcontentloaded')
+                await wait_for_page(page)
                 try:
-                    page.select_option(EDITOR_CONFIG["selector"], editor["type"])
-                    page.locator("input[type='submit']").click()
-                    page.wait_for_load_state('networkidle')
-                    page.goto(f"{{url}}{{EDITOR_CONFIG['form_url']}}")
-                    page.wait_for_load_state('networkidle')
-                    time.sleep(2)
-                    capture(page, editor["filename"], full_page=True)
+                    await click_tab(page, EDITOR_CONFIG["tab"])
+                    await page.select_option(EDITOR_CONFIG["selector"], editor["type"])
+                    async with page.expect_navigation(wait_until='domcontentloaded'):
+                        await page.locator("input[type='submit']").click()
+                    await page.goto(f"{{url}}{{EDITOR_CONFIG['form_url']}}", wait_until='domcontentloaded')
+                    await wait_for_page(page, "form")
+                    await capture(page, editor["filename"], full_page=True)
                 except Exception as e:
                     print(f"    Error: {{e}}")
 
@@ -456,18 +555,17 @@ def main():
             print("\\n--- Frontend Screenshots ---\\n")
             for pg in FRONTEND_PAGES:
                 print(f"  Page: {{pg['url']}}")
-                page.goto(f"{{url}}{{pg['url']}}")
-                page.wait_for_load_state('networkidle')
-                time.sleep(2)
-                capture(page, pg["file"], pg.get("full_page", False))
+                await page.goto(f"{{url}}{{pg['url']}}", wait_until='domcontentloaded')
+                await wait_for_page(page, "body")
+                await capture(page, pg["file"], pg.get("full_page", False))
 
-        context.close()
+        await browser.close()
 
     print(f"\\n=== Done! Screenshots in {{IMAGES_DIR}} ===\\n")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 '''
 
     return script
@@ -480,11 +578,15 @@ def main():
     parser.add_argument("--user", type=int, default=1, help="User ID for login (default: 1)")
     parser.add_argument("--plugin-path", help="Path to plugin directory")
     parser.add_argument("--output", help="Output capture script path")
+    parser.add_argument("--headful", action="store_true",
+                        help="Show the browser window (default: headless)")
+    parser.add_argument("--pretty-json", action="store_true",
+                        help="Also save an indented copy of the structure JSON")
 
     args = parser.parse_args()
 
     # Discover structure
-    structure = discover_plugin_structure(args.url, args.page, args.user)
+    structure = asyncio.run(discover_plugin_structure(args.url, args.page, args.user, args.headful))
 
     if not structure:
         print("\nDiscovery failed!")
@@ -518,9 +620,15 @@ def main():
     # Save structure as JSON for reference
     json_path = f"/tmp/{args.page}-structure.json"
     with open(json_path, 'w') as f:
-        json.dump(structure, f, indent=2)
+        json.dump(structure, f, separators=(',', ':'))
     print(f"\nStructure JSON saved to: {json_path}")
 
+    if args.pretty_json:
+        pretty_path = f"/tmp/{args.page}-structure.pretty.json"
+        with open(pretty_path, 'w') as f:
+            json.dump(structure, f, indent=2)
+        print(f"Readable copy saved to: {pretty_path}")
+
     return 0
 
 